@@ -3,11 +3,26 @@
 支持三种文件类型：1双语、2原文、3外教
 基于三遍验证技术，确保统计准确性
 """
+from collections import Counter
+from datetime import datetime
+
 import streamlit as st
-from utils.book_processor import validate_uploaded_files, process_book_files
+from utils.book_processor import validate_uploaded_files, process_book_bytes
 from utils.txt_exporter import generate_txt_report, get_download_filename
 
 
+@st.cache_data(show_spinner=False)
+def run_analysis(file_entries, enable_verification):
+    """
+    按文件内容哈希缓存统计结果
+
+    Streamlit每次交互都会重跑main()；st.cache_data以文件字节+选项为键，
+    同一批文件只统计一次，之后切换选项直接复用缓存。
+    勾选"启用三遍验证"即用户显式要求三遍交叉验证，映射到deep=True。
+    """
+    return process_book_bytes(file_entries, enable_verification, deep=enable_verification)
+
+
 def main():
     # 页面配置
     st.set_page_config(
@@ -117,9 +132,14 @@ def main():
         
         if st.button("🚀 开始统计（三遍验证）", type="primary", use_container_width=True):
             with st.spinner("正在统计词汇量..."):
-                # 处理文件
-                results = process_book_files(file_types, enable_verification=enable_verification)
-                
+                # 处理文件（按内容哈希缓存，重复统计同一批文件时直接复用）
+                file_entries = tuple(
+                    (ft, file_types[ft].name, file_types[ft].getvalue())
+                    for ft in ['1双语', '2原文', '3外教']
+                    if ft in file_types
+                )
+                results = run_analysis(file_entries, enable_verification)
+
                 # 保存结果到session state
                 st.session_state['results'] = results
                 st.session_state['file_types'] = file_types
@@ -200,10 +220,10 @@ def main():
                 
                 # 高频词（Top 10）
                 if 'word_freq' in stats:
-                    word_freq = stats['word_freq']
-                    sorted_words = sorted(word_freq.items(), key=lambda x: x[1], reverse=True)
-                    top_10 = sorted_words[:10]
-                    
+                    # most_common用堆取Top K（O(V log K)），避免对全部词频排序
+                    top_10 = Counter(stats['word_freq']).most_common(10)
+
+
                     st.markdown("**🔝 Top 10 高频词:**")
                     top_10_str = ', '.join([f"{word}({count})" for word, count in top_10])
                     st.caption(top_10_str)
@@ -230,9 +250,10 @@ def main():
             # 提取书名（去掉前缀和后缀）
             book_name = filename.replace('2原文-', '').replace('_原文', '').replace('.txt', '')
         
-        # 生成TXT报告
-        txt_report = generate_txt_report(results, book_name)
-        download_filename = get_download_filename(book_name)
+        # 生成TXT报告（报告头与文件名共用同一时间戳，避免两次取时间产生漂移）
+        now = datetime.now()
+        txt_report = generate_txt_report(results, book_name, now=now)
+        download_filename = get_download_filename(book_name, now=now)
         
         st.download_button(
             label="📥 下载TXT报告",
@@ -5,7 +5,7 @@ from .verify import verify_text, get_verification_summary
 from .word_analyzer import analyze_text
 from .text_cleaner import extract_english_only
 from .contraction_handler import expand_contractions, extract_words_with_smart_contractions
-from .book_processor import process_book_files, identify_file_type
+from .book_processor import process_book_files, process_book_bytes, identify_file_type
 from .txt_exporter import generate_txt_report, get_download_filename
 
 __all__ = [
@@ -16,6 +16,7 @@ __all__ = [
     'expand_contractions',
     'extract_words_with_smart_contractions',
     'process_book_files',
+    'process_book_bytes',
     'identify_file_type',
     'generate_txt_report',
     'get_download_filename'
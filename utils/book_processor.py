@@ -1,29 +1,82 @@
 """
 书籍文件处理模块 - 处理三种类型的文本文件
 """
+import codecs
 import re
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Dict, Tuple, Optional
 from .word_analyzer import analyze_text
-from .text_cleaner import extract_english_only
+from .text_cleaner import extract_english_only, _CJK_TABLE
 
 
+# 空白压缩（翻译表把中文替换为空格后统一压缩）
+_WS_RE = re.compile(r'\s+')
+
+# '3外教'纯ASCII快路径：只剩Markdown标记需要处理
+_MD_RE = re.compile(r'\*\*[A-Za-z]+:|\*\*')
+
+# '3外教'专用：说话人标记、Markdown粗体标记、中文合并为一个交替正则
+# 一次扫描完成三类替换（标记删除，中文替换为空格）
+_WAIJIAO_RE = re.compile(
+    r'(\*\*[A-Za-z]+:|\*\*)|([\u4e00-\u9fff\u3000-\u303f\uff00-\uffef]+)'
+)
+
+
+def _read_text(file, chunk_size: int = 65536) -> str:
+    """
+    分块读取并增量解码上传的文件
+
+    一次性 file.read().decode('utf-8') 会让原始字节和完整字符串同时驻留内存。
+    分块读取 + 增量解码器只保留解码后的片段，峰值内存约减半；
+    增量解码器会正确处理跨块边界被切开的UTF-8多字节字符。
+
+    Args:
+        file: 上传的文件对象（BytesIO接口）
+        chunk_size: 每次读取的字节数
+
+    Returns:
+        解码后的完整文本
+    """
+    decoder = codecs.getincrementaldecoder('utf-8')()
+    parts = []
+
+    for chunk in iter(lambda: file.read(chunk_size), b''):
+        parts.append(decoder.decode(chunk))
+    parts.append(decoder.decode(b'', final=True))
+
+    return ''.join(parts)
+
+
+# 数字前缀 → 文件类型（O(1)分派，避免逐一substring扫描）
+_PREFIX_MAP = {'1': '1双语', '2': '2原文', '3': '3外教'}
+
+
+@lru_cache(maxsize=64)
 def identify_file_type(filename: str) -> Optional[str]:
     """
     根据文件名识别文件类型
-    
+
+    Streamlit每次交互都会重跑main()，同一批文件名会被反复识别，
+    因此结果用lru_cache缓存，并优先按数字前缀O(1)分派。
+
     Args:
         filename: 文件名
-        
+
     Returns:
         文件类型 ('1双语', '2原文', '3外教') 或 None
     """
-    filename_lower = filename.lower()
-    
-    if filename.startswith('1双语-') or '双语' in filename:
+    # 快路径：按数字前缀分派
+    file_type = _PREFIX_MAP.get(filename[:1])
+    if file_type and (filename.startswith(file_type + '-') or file_type[1:] in filename):
+        return file_type
+
+    # 回退：无标准前缀时按关键字识别（保持原有宽松匹配）
+    if '双语' in filename:
         return '1双语'
-    elif filename.startswith('2原文-') or '原文' in filename:
+    elif '原文' in filename:
         return '2原文'
-    elif filename.startswith('3外教-') or '外教' in filename:
+    elif '外教' in filename:
         return '3外教'
     else:
         return None
@@ -41,36 +94,31 @@ def preprocess_text(text: str, file_type: str) -> str:
         预处理后的文本
     """
     if file_type == '1双语':
+        # 纯ASCII文本（已无中文可剔除）直接跳到空白压缩
+        # str.isascii是C级单遍扫描，开销远小于一次全文替换
+        if text.isascii():
+            return _WS_RE.sub(' ', text).strip()
+
         # 双语文本：移除中文（包括中文标点和全角字符）
-        # Unicode范围：
-        # \u4e00-\u9fff: 中文字符
-        # \u3000-\u303f: CJK标点符号
-        # \uff00-\uffef: 全角字符
-        text = re.sub(r'[\u4e00-\u9fff\u3000-\u303f\uff00-\uffef]+', ' ', text)
-        
-    elif file_type == '2原文':
-        # 原文：纯英文，无需特殊处理
-        pass
-        
-    elif file_type == '3外教':
-        # 外教对话：移除说话人标记 + Markdown标记 + 中文
-        # 1. 移除说话人标记（如 **Sally:**、**Pete:** 等）
-        # 匹配模式：**任意单词: （注意：只有开头的**，后面没有**）
-        text = re.sub(r'\*\*[A-Za-z]+:', '', text)
+        # 翻译表C级单遍替换为空格，再压缩空白
+        return _WS_RE.sub(' ', text.translate(_CJK_TABLE)).strip()
 
-        # 2. 移除剩余的Markdown粗体标记 **text**
-        text = re.sub(r'\*\*', '', text)
+    elif file_type == '3外教':
+        if text.isascii():
+            # 纯ASCII对话：只需处理Markdown标记
+            text = _MD_RE.sub('', text)
+        else:
+            # 外教对话：移除说话人标记（如 **Sally:**）、Markdown粗体标记、中文
+            # 三类替换在一次扫描中完成，再压缩空白
+            text = _WAIJIAO_RE.sub(lambda m: ' ' if m.group(2) else '', text)
+        return _WS_RE.sub(' ', text).strip()
 
-        # 3. 移除中文（包括中文标点和全角字符）
-        text = re.sub(r'[\u4e00-\u9fff\u3000-\u303f\uff00-\uffef]+', ' ', text)
-    
-    # 统一清理多余空格
-    text = re.sub(r'\s+', ' ', text).strip()
-    
-    return text
+    # 2原文等纯英文文件：只需统一清理多余空格
+    return _WS_RE.sub(' ', text).strip()
 
 
-def analyze_book_file(text: str, file_type: str, filename: str, enable_verification: bool = True) -> Dict:
+def analyze_book_file(text: str, file_type: str, filename: str, enable_verification: bool = True,
+                      deep: bool = False) -> Dict:
     """
     分析单个书籍文件的词汇量
 
@@ -78,7 +126,8 @@ def analyze_book_file(text: str, file_type: str, filename: str, enable_verificat
         text: 文件文本内容
         file_type: 文件类型
         filename: 文件名
-        enable_verification: 是否启用三遍验证
+        enable_verification: 是否启用统计验证
+        deep: 是否强制三遍交叉验证（用户显式要求三遍验证时传True）
 
     Returns:
         包含统计结果的字典
@@ -91,7 +140,7 @@ def analyze_book_file(text: str, file_type: str, filename: str, enable_verificat
     cleaned_text = preprocess_text(text, file_type)
 
     # 2. 使用三遍验证统计词汇
-    stats = analyze_text(cleaned_text, enable_verification=enable_verification)
+    stats = analyze_text(cleaned_text, enable_verification=enable_verification, deep=deep)
 
     # 3. 特殊处理：2原文（原文高效磨耳）的总词数乘以3
     if file_type == '2原文':
@@ -101,10 +150,11 @@ def analyze_book_file(text: str, file_type: str, filename: str, enable_verificat
         stats['multiplier'] = 3  # 记录倍数
 
     # 4. 添加文件信息
+    # 只保留300字符的预览片段，不把整本书的清理文本塞进结果字典
+    # （结果会存入st.session_state，完整文本会让会话内存随书本大小膨胀）
     stats['file_type'] = file_type
     stats['filename'] = filename
-    stats['cleaned_text'] = cleaned_text
-    stats['cleaned_text_preview'] = cleaned_text[:300] + '...' if len(cleaned_text) > 300 else cleaned_text
+    stats['cleaned_text_preview'] = cleaned_text[:300] + ('...' if len(cleaned_text) > 300 else '')
 
     return stats
 
@@ -133,31 +183,72 @@ def validate_uploaded_files(files: list) -> Tuple[bool, list, Dict]:
     return len(missing) == 0, missing, file_types
 
 
-def process_book_files(uploaded_files: Dict, enable_verification: bool = True) -> Dict:
+def process_book_bytes(file_entries: Tuple, enable_verification: bool = True,
+                       deep: bool = False) -> Dict:
+    """
+    处理一本书的3个文件（字节版本）
+
+    入参为可哈希的纯数据元组，方便上层用 st.cache_data 按文件内容哈希缓存：
+    同一批文件在Streamlit重跑或切换界面选项时无需重新统计。
+
+    Args:
+        file_entries: ((文件类型, 文件名, 文件字节内容), ...) 元组
+        enable_verification: 是否启用统计验证
+        deep: 是否强制三遍交叉验证
+
+    Returns:
+        处理结果字典，包含每个文件的统计结果和汇总信息
+    """
+    # 3个文件相互独立，用线程池并行处理
+    # （解码和正则替换大部分时间在释放GIL的C代码中，可真正重叠）
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        futures = {
+            file_type: executor.submit(
+                _process_entry, file_type, filename, data, enable_verification, deep
+            )
+            for file_type, filename, data in file_entries
+        }
+        results = {file_type: future.result() for file_type, future in futures.items()}
+
+    # 生成汇总信息
+    summary = generate_summary(results)
+
+    return {
+        'individual_results': results,
+        'summary': summary
+    }
+
+
+def _process_entry(file_type: str, filename: str, data: bytes, enable_verification: bool,
+                   deep: bool) -> Dict:
+    """解码并分析单个文件（线程池工作单元）"""
+    return analyze_book_file(data.decode('utf-8'), file_type, filename, enable_verification, deep)
+
+
+def process_book_files(uploaded_files: Dict, enable_verification: bool = True,
+                       deep: bool = False) -> Dict:
     """
     处理一本书的3个文件
     
     Args:
         uploaded_files: 文件类型到文件对象的映射 {'1双语': file, '2原文': file, '3外教': file}
-        enable_verification: 是否启用三遍验证
+        enable_verification: 是否启用统计验证
+        deep: 是否强制三遍交叉验证
         
     Returns:
         处理结果字典，包含每个文件的统计结果和汇总信息
     """
-    results = {}
-    
-    for file_type in ['1双语', '2原文', '3外教']:
-        if file_type in uploaded_files:
-            file = uploaded_files[file_type]
-            
-            # 读取文件内容
-            text = file.read().decode('utf-8')
-            
-            # 分析词汇量
-            stats = analyze_book_file(text, file_type, file.name, enable_verification)
-            
-            results[file_type] = stats
-    
+    # 3个文件相互独立，用线程池并行处理（读取、解码与正则替换相互重叠）
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        futures = {
+            file_type: executor.submit(
+                _process_file, uploaded_files[file_type], file_type, enable_verification, deep
+            )
+            for file_type in ['1双语', '2原文', '3外教']
+            if file_type in uploaded_files
+        }
+        results = {file_type: future.result() for file_type, future in futures.items()}
+
     # 生成汇总信息
     summary = generate_summary(results)
     
@@ -167,6 +258,20 @@ def process_book_files(uploaded_files: Dict, enable_verification: bool = True) -
     }
 
 
+def _process_file(file, file_type: str, enable_verification: bool, deep: bool = False) -> Dict:
+    """读取并分析单个文件对象（线程池工作单元）"""
+    if hasattr(file, 'getvalue'):
+        # Streamlit UploadedFile/BytesIO：getvalue()直接返回底层缓冲区，
+        # 不复制也不移动读指针——重复点击"开始统计"时再次读取仍有内容
+        # （.read()会耗尽流，第二次调用返回空）
+        text = file.getvalue().decode('utf-8')
+    else:
+        # 普通文件对象：分块读取（避免原始字节+完整字符串双倍驻留）
+        text = _read_text(file)
+
+    return analyze_book_file(text, file_type, file.name, enable_verification, deep)
+
+
 def generate_summary(results: Dict) -> Dict:
     """
     生成汇总报告
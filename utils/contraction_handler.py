@@ -4,6 +4,13 @@
 import re
 from typing import List
 
+try:
+    # 可选依赖：pyahocorasick提供O(n)多模式匹配自动机（DFA，无回溯）
+    # 扫描耗时与缩写表大小无关；未安装时回退到交替正则
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
 
 # 标准缩写映射表（拆分为2个词）
 STANDARD_CONTRACTIONS = {
@@ -80,30 +87,117 @@ STANDARD_CONTRACTIONS = {
 }
 
 
+# 预编译：把所有标准缩写合并成一个交替正则，一次扫描完成全部替换
+# （按长度降序排列，避免前缀遮蔽，如 cannot vs can't）
+_CONTRACTION_RE = re.compile(
+    r'\b(' + '|'.join(
+        re.escape(k) for k in sorted(STANDARD_CONTRACTIONS, key=len, reverse=True)
+    ) + r')\b',
+    re.IGNORECASE
+)
+
+# 预计算：缩写（小写） → 展开后的字符串
+_EXPANSION = {k: ' '.join(v) for k, v in STANDARD_CONTRACTIONS.items()}
+
+# 预计算：常见大小写变体（原样/首字母大写/全大写）直接命中展开结果，
+# 替换回调里无需每次调用.lower()；展开结果保持对应的大小写形式
+# （罕见的混合大小写如 dON'T 走.lower()回退路径）
+_EXPANSION_VARIANTS = {}
+for _k, _joined in _EXPANSION.items():
+    _EXPANSION_VARIANTS[_k] = _joined
+    _EXPANSION_VARIANTS[_k.capitalize()] = _joined.capitalize()
+    _EXPANSION_VARIANTS[_k.upper()] = _joined.upper()
+
+# 可选：Aho-Corasick自动机，一次扫描定位全部缩写
+if ahocorasick is not None:
+    _CONTRACTION_AUTOMATON = ahocorasick.Automaton()
+    for _k, _v in _EXPANSION.items():
+        _CONTRACTION_AUTOMATON.add_word(_k, (len(_k), _v))
+    _CONTRACTION_AUTOMATON.make_automaton()
+else:
+    _CONTRACTION_AUTOMATON = None
+
+# 预计算：ASCII非词字符 → 空格（translate+split分词，C级单遍扫描，无正则开销）
+# 数字和下划线保留为词字符，随后整token丢弃——对齐正则词边界语义：
+# 紧邻数字/下划线的字母串（如 1990s、word2vec、foo_bar）不拆出碎片词
+_NONWORD_TABLE = {
+    c: 0x20 for c in range(128)
+    if not (65 <= c <= 90 or 97 <= c <= 122 or 48 <= c <= 57 or c == 95)
+}
+
+# 含非ASCII字符时的分词回退路径（文本已整体小写，只需匹配小写字母）
+_WORD_RE = re.compile(r'\b[a-z]+\b')
+
+# 所有格：前面必须是字母（环视不消耗字符，无捕获组/反向引用开销）
+# 裸引号内的词（如 'stop'）前导撇号不匹配，不会被误删首字母
+_POSSESSIVE_RE = re.compile(r"(?<=[a-zA-Z])'[sS](?![a-zA-Z])")
+
+# 连字符词：字母-字母
+_HYPHEN_RE = re.compile(r'([a-zA-Z]+)-([a-zA-Z]+)')
+
+
+def _expand_with_automaton(text: str) -> str:
+    """
+    用Aho-Corasick自动机展开标准缩写（单遍扫描，与缩写表大小无关）
+
+    自动机在小写副本上定位缩写，按词边界检查后在原文上拼接替换片段；
+    被更长匹配包含的子串（如 there's 中的 here's）会因左边界是字母而被跳过。
+    """
+    lower = text.lower()
+    n = len(lower)
+    parts = []
+    last = 0
+
+    for end, (length, replacement) in _CONTRACTION_AUTOMATON.iter(lower):
+        start = end - length + 1
+        if start < last:
+            # 与已替换的区间重叠，跳过
+            continue
+        # 词边界检查（对应正则中的 \b）
+        if start > 0 and (lower[start - 1].isalnum() or lower[start - 1] == '_'):
+            continue
+        if end + 1 < n and (lower[end + 1].isalnum() or lower[end + 1] == '_'):
+            continue
+
+        parts.append(text[last:start])
+        # 按原文大小写形式选择展开结果（与正则路径一致）
+        original = text[start:end + 1]
+        parts.append(_EXPANSION_VARIANTS.get(original) or replacement)
+        last = end + 1
+
+    parts.append(text[last:])
+    return ''.join(parts)
+
+
 def expand_contractions(text: str) -> str:
     """
     智能展开缩写
     - 标准缩写（如 I'm, you're）拆分为2个词
     - 所有格（如 Uncle's, Sally's）保持为1个词（移除's）
-    
+
     Args:
         text: 输入文本
-    
+
     Returns:
         展开后的文本
     """
-    # 步骤1: 展开标准缩写
-    for contraction, expansion in STANDARD_CONTRACTIONS.items():
-        # 使用单词边界确保完整匹配
-        pattern = r'\b' + re.escape(contraction) + r'\b'
-        replacement = ' '.join(expansion)
-        text = re.sub(pattern, replacement, text, flags=re.IGNORECASE)
-    
+    # 步骤1: 展开标准缩写（单次扫描，替代逐条re.sub的N次全文扫描）
+    if _CONTRACTION_AUTOMATON is not None:
+        text = _expand_with_automaton(text)
+    else:
+        # 常见大小写变体直接命中，仅混合大小写才需要.lower()回退
+        text = _CONTRACTION_RE.sub(
+            lambda m: _EXPANSION_VARIANTS.get(m.group(1)) or _EXPANSION[m.group(1).lower()],
+            text
+        )
+
     # 步骤2: 处理所有格（移除's，保持为1个词）
-    # 匹配模式：单词 + 's（但不是标准缩写）
     # 例如：Uncle's → Uncle, Sally's → Sally
-    text = re.sub(r"\b([a-zA-Z]+)'s\b", r'\1', text)
-    
+    # 标准缩写已在步骤1展开，剩余的字母+'s都是所有格；
+    # 环视保证撇号前是字母——裸str.replace会把引号内的词（'stop'）
+    # 误当所有格剥掉首字母
+    text = _POSSESSIVE_RE.sub('', text)
+
     return text
 
 
@@ -119,14 +213,16 @@ def extract_words_with_smart_contractions(text: str) -> List[str]:
     """
     # 先展开缩写
     expanded_text = expand_contractions(text)
-    
-    # 提取单词
-    words = re.findall(r'\b[a-zA-Z]+\b', expanded_text)
-    
-    # 转为小写
-    words_lower = [word.lower() for word in words]
-    
-    return words_lower
+
+    if expanded_text.isascii():
+        # 纯ASCII快路径：翻译表把非词字符替换为空格，整体小写一次后split；
+        # 混有数字/下划线的token整个丢弃，与正则回退路径的词边界一致
+        tokens = expanded_text.translate(_NONWORD_TABLE).lower().split()
+        return [token for token in tokens if token.isalpha()]
+
+    # 含非ASCII字符（如弯引号）时走正则路径
+    # 整体小写一次（C级向量化路径），省去逐词的Python层.lower()调用
+    return _WORD_RE.findall(expanded_text.lower())
 
 
 def handle_hyphenated_words(text: str, keep_as_one: bool = True) -> str:
@@ -146,11 +242,11 @@ def handle_hyphenated_words(text: str, keep_as_one: bool = True) -> str:
     if keep_as_one:
         # 将连字符替换为下划线，保持为一个token
         # 例如：well-being → well_being
-        text = re.sub(r'([a-zA-Z]+)-([a-zA-Z]+)', r'\1_\2', text)
+        text = _HYPHEN_RE.sub(r'\1_\2', text)
     else:
         # 将连字符替换为空格，拆分为多个词
         # 例如：well-being → well being
-        text = re.sub(r'([a-zA-Z]+)-([a-zA-Z]+)', r'\1 \2', text)
+        text = _HYPHEN_RE.sub(r'\1 \2', text)
 
     return text
 
@@ -4,6 +4,29 @@
 import re
 
 
+# 预计算：中文/全角字符 → 空格 的翻译表（str.translate为C级单遍扫描，无正则状态机开销）
+# Unicode范围：\u4e00-\u9fff (中文), \u3000-\u303f (CJK标点), \uff00-\uffef (全角字符)
+_CJK_TABLE = {cp: 0x20 for cp in range(0x4e00, 0xa000)}
+_CJK_TABLE.update({cp: 0x20 for cp in range(0x3000, 0x3040)})
+_CJK_TABLE.update({cp: 0x20 for cp in range(0xff00, 0xfff0)})
+
+# 非ASCII字符与空白（含中文）
+_NON_ASCII_WS_RE = re.compile(r'(?:[^\x00-\x7F]|\s)+')
+# 非字母数字字符（含空白和标点）
+_NON_ALNUM_RE = re.compile(r'[^a-zA-Z0-9]+')
+# 空白压缩
+_WS_RE = re.compile(r'\s+')
+# 行内多余空格压缩（保留换行时使用）
+_MULTI_SPACE_RE = re.compile(r' +')
+# 中文/全角字符（直接删除，保留行结构时使用）
+_CJK_DELETE_RE = re.compile(r'[\u4e00-\u9fff\u3000-\u303f\uff00-\uffef]+')
+# clean_text_advanced 的各保留选项对应的过滤模式
+_NON_ASCII_RE = re.compile(r'[^\x00-\x7F]+')
+_NON_ALNUM_NL_RE = re.compile(r'[^a-zA-Z0-9\s\n]')
+_NON_ALPHA_PUNCT_NL_RE = re.compile(r'[^a-zA-Z\s\n.!?,;:\'"()-]')
+_NON_ALPHA_NL_RE = re.compile(r'[^a-zA-Z\s\n]')
+
+
 def remove_chinese(text: str, keep_punctuation: bool = True) -> str:
     """
     剔除文本中的中文字符，只保留英文内容
@@ -17,18 +40,13 @@ def remove_chinese(text: str, keep_punctuation: bool = True) -> str:
     """
     if keep_punctuation:
         # 保留英文字母、数字、空格、常见英文标点
-        # 移除中文字符（包括中文标点）
-        pattern = r'[^\x00-\x7F]+'  # 移除所有非ASCII字符（包括中文）
-        cleaned = re.sub(pattern, ' ', text)
+        # 移除所有非ASCII字符（包括中文），同时压缩空白（一次扫描）
+        cleaned = _NON_ASCII_WS_RE.sub(' ', text)
     else:
-        # 只保留英文字母、数字和空格
-        cleaned = re.sub(r'[^a-zA-Z0-9\s]', ' ', text)
+        # 只保留英文字母和数字，同时压缩空白（一次扫描）
+        cleaned = _NON_ALNUM_RE.sub(' ', text)
 
-    # 清理多余空格
-    cleaned = re.sub(r'\s+', ' ', cleaned)
-    cleaned = cleaned.strip()
-
-    return cleaned
+    return cleaned.strip()
 
 
 def extract_english_only(text: str, preserve_structure: bool = False) -> str:
@@ -49,9 +67,9 @@ def extract_english_only(text: str, preserve_structure: bool = False) -> str:
 
         for line in lines:
             # 移除中文字符
-            cleaned_line = re.sub(r'[\u4e00-\u9fff\u3000-\u303f\uff00-\uffef]+', '', line)
+            cleaned_line = _CJK_DELETE_RE.sub('', line)
             # 清理多余空格
-            cleaned_line = re.sub(r'\s+', ' ', cleaned_line).strip()
+            cleaned_line = _WS_RE.sub(' ', cleaned_line).strip()
 
             # 只保留有内容的行
             if cleaned_line:
@@ -59,15 +77,8 @@ def extract_english_only(text: str, preserve_structure: bool = False) -> str:
 
         return '\n'.join(cleaned_lines)
     else:
-        # 移除所有中文字符（包括中文标点）
-        # Unicode范围：\u4e00-\u9fff (中文), \u3000-\u303f (CJK标点), \uff00-\uffef (全角字符)
-        cleaned = re.sub(r'[\u4e00-\u9fff\u3000-\u303f\uff00-\uffef]+', ' ', text)
-
-        # 清理多余空格
-        cleaned = re.sub(r'\s+', ' ', cleaned)
-        cleaned = cleaned.strip()
-
-        return cleaned
+        # 移除所有中文字符（包括中文标点）：翻译表单遍替换为空格，再压缩空白
+        return _WS_RE.sub(' ', text.translate(_CJK_TABLE)).strip()
 
 
 def clean_text_advanced(text: str, options: dict = None) -> str:
@@ -95,32 +106,32 @@ def clean_text_advanced(text: str, options: dict = None) -> str:
 
     result = text
 
-    # 移除中文
+    # 移除中文（翻译表单遍替换为空格）
     if remove_chinese:
-        result = re.sub(r'[\u4e00-\u9fff\u3000-\u303f\uff00-\uffef]+', ' ', result)
+        result = result.translate(_CJK_TABLE)
 
     # 构建保留字符的正则
     if keep_numbers and keep_punctuation:
         # 保留英文字母、数字、标点和空格
-        result = re.sub(r'[^\x00-\x7F]+', ' ', result)
+        result = _NON_ASCII_RE.sub(' ', result)
     elif keep_numbers:
         # 只保留英文字母、数字和空格
-        result = re.sub(r'[^a-zA-Z0-9\s\n]', ' ', result)
+        result = _NON_ALNUM_NL_RE.sub(' ', result)
     elif keep_punctuation:
         # 只保留英文字母、标点和空格
-        result = re.sub(r'[^a-zA-Z\s\n.!?,;:\'"()-]', ' ', result)
+        result = _NON_ALPHA_PUNCT_NL_RE.sub(' ', result)
     else:
         # 只保留英文字母和空格
-        result = re.sub(r'[^a-zA-Z\s\n]', ' ', result)
+        result = _NON_ALPHA_NL_RE.sub(' ', result)
 
     # 处理空格和换行
     if preserve_newlines:
         # 保留换行，但清理每行的多余空格
         lines = result.split('\n')
-        result = '\n'.join(re.sub(r' +', ' ', line).strip() for line in lines)
+        result = '\n'.join(_MULTI_SPACE_RE.sub(' ', line).strip() for line in lines)
     else:
         # 统一清理空格
-        result = re.sub(r'\s+', ' ', result)
+        result = _WS_RE.sub(' ', result)
 
     return result.strip()
 
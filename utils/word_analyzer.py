@@ -1,19 +1,71 @@
 """
 词汇分析模块 - 统计英文词汇（三遍验证）
 """
+import csv
+import hashlib
+import os
 import re
-from collections import Counter
-from typing import Dict, List
-from .verify import verify_text, get_verification_summary
+import threading
+from collections import Counter, OrderedDict
+from typing import Dict, List, Optional
+from .verify import verify_text, get_verification_summary, _ordered_unique, _SMALL_TEXT_LIMIT
 
 
-def analyze_text(text: str, enable_verification: bool = True) -> Dict:
+# 预编译：完整英文单词（快速模式的分词）
+_ALPHA_WORD_RE = re.compile(r'\b[a-zA-Z]+\b')
+
+
+# 快速模式的纯ASCII查找表：大写 → 小写，小写/数字/下划线保留，其余 → 空格
+# 数字和下划线保留在token里，随后整token丢弃——对齐正则的词边界语义：
+# 紧邻数字的字母串（如 1990s、5th）不算词
+_BOUNDED_WORD_BYTES = bytes(
+    c + 32 if 65 <= c <= 90
+    else (c if 97 <= c <= 122 or 48 <= c <= 57 or c == 95 else 0x20)
+    for c in range(256)
+)
+
+
+def _ascii_bounded_word_freq(text: str) -> Counter:
+    """
+    纯ASCII文本的词频统计，语义与_ALPHA_WORD_RE完全一致
+
+    词字符（字母/数字/下划线）连续段中只有纯字母的才算词，
+    与正则路径一样排除1990s、5th这类混合token。
+    """
+    buf = text.encode('ascii').translate(_BOUNDED_WORD_BYTES)
+
+    if len(buf) < _SMALL_TEXT_LIMIT:
+        return Counter(t for t in buf.decode('ascii').split() if t.isalpha())
+
+    counts = Counter(t for t in buf.split() if t.isalpha())
+    return Counter({w.decode('ascii'): c for w, c in counts.items()})
+
+
+# 结果缓存：文本哈希 → 统计结果（LRU，上限32条）
+# 界面刷新/导出流程常对同一文档重复调用analyze_text，缓存后只统计一次；
+# 以blake2b摘要做键，避免把整本书的文本留在缓存键里
+# analyze_text会被process_book_bytes的线程池并发调用，
+# 读取/置顶/淘汰必须在锁内完成（并发淘汰会让move_to_end抛KeyError）
+_STATS_CACHE: OrderedDict = OrderedDict()
+_STATS_CACHE_MAX = 32
+_STATS_CACHE_LOCK = threading.Lock()
+
+
+def analyze_text(text: str, enable_verification: bool = True, deep: bool = False,
+                 sort: Optional[str] = 'alpha') -> Dict:
     """
     分析文本中的英文词汇（支持三遍验证）
 
+    同一文本的重复调用命中内部LRU缓存，直接返回已有统计结果的浅拷贝
+    （拷贝是必要的：analyze_book_file会就地改写返回的字典）。
+
     Args:
         text: 输入文本
-        enable_verification: 是否启用三遍统计验证（默认True）
+        enable_verification: 是否启用统计验证（默认True）
+        deep: 是否强制三遍交叉验证；默认只运行最准确的方法1并做
+              健全性检查，方法结论可疑时才自动补跑方法2/3
+        sort: 唯一词列表的排序方式——'alpha'按字母全排序（默认），
+              'freq'按词频降序，None保持Counter插入序、跳过排序
 
     Returns:
         包含统计数据的字典:
@@ -25,9 +77,34 @@ def analyze_text(text: str, enable_verification: bool = True) -> Dict:
         - verification_status: 验证状态摘要
         - verification_detail: 详细验证信息
     """
+    key = (
+        hashlib.blake2b(text.encode('utf-8'), digest_size=16).digest(),
+        enable_verification,
+        deep,
+        sort,
+    )
+    with _STATS_CACHE_LOCK:
+        cached = _STATS_CACHE.get(key)
+        if cached is not None:
+            _STATS_CACHE.move_to_end(key)
+    if cached is not None:
+        return dict(cached)
+
+    stats = _analyze_text(text, enable_verification, deep, sort)
+
+    with _STATS_CACHE_LOCK:
+        _STATS_CACHE[key] = dict(stats)
+        if len(_STATS_CACHE) > _STATS_CACHE_MAX:
+            _STATS_CACHE.popitem(last=False)
+
+    return stats
+
+
+def _analyze_text(text: str, enable_verification: bool, deep: bool, sort: Optional[str]) -> Dict:
+    """实际执行统计（analyze_text的缓存未命中路径）"""
     if enable_verification:
-        # 使用三遍统计验证
-        verification_report = verify_text(text)
+        # 使用统计验证（常规路径1遍，可疑或deep=True时3遍交叉）
+        verification_report = verify_text(text, deep=deep, sort=sort)
 
         # 提取最终统计结果
         stats = verification_report['final_stats']
@@ -40,24 +117,89 @@ def analyze_text(text: str, enable_verification: bool = True) -> Dict:
 
         return stats
     else:
-        # 单次统计（快速模式）
-        words = re.findall(r'\b[a-zA-Z]+\b', text)
-        words_lower = [word.lower() for word in words]
-
-        total_words = len(words_lower)
-        word_freq = Counter(words_lower)
-        unique_words = len(word_freq)
-        unique_word_list = sorted(word_freq.keys())
-
-        return {
-            'total_words': total_words,
-            'unique_words': unique_words,
-            'unique_word_list': unique_word_list,
-            'word_freq': dict(word_freq),
-            'verified': None,
-            'verification_status': '未验证（快速模式）',
-            'verification_detail': '未启用验证'
-        }
+        # 单次统计（快速模式）：一遍构建Counter，其余指标都从它派生
+        # （不再保留中间words列表，峰值内存约减半）
+        if text.isascii():
+            # 纯ASCII快路径：bytes域分类+计数，只解码唯一词
+            word_freq = _ascii_bounded_word_freq(text)
+        else:
+            # 生成器直接喂Counter：逐token就地累加，不物化中间列表
+            word_freq = Counter(
+                m.group(0) for m in _ALPHA_WORD_RE.finditer(text.lower())
+            )
+
+        return _fast_stats(word_freq, sort)
+
+
+def _fast_stats(word_freq: Counter, sort: Optional[str] = 'alpha') -> Dict:
+    """由词频Counter派生快速模式的统计字典"""
+    return {
+        'total_words': sum(word_freq.values()),
+        'unique_words': len(word_freq),
+        'unique_word_list': _ordered_unique(word_freq, sort),
+        'word_freq': word_freq,
+        'verified': None,
+        'verification_status': '未验证（快速模式）',
+        'verification_detail': '未启用验证'
+    }
+
+
+def analyze_texts(texts: List[str], sort: Optional[str] = 'alpha') -> List[Dict]:
+    """
+    批量分析多个文本（快速模式）
+
+    所有文本用非字母哨兵（NUL字符）拼接后做一次正则扫描，按前缀偏移
+    把token归还到各自文档——N个小文档只付一次Python→C的正则调用开销，
+    等价于对每篇分别调用analyze_text(enable_verification=False)。
+
+    Args:
+        texts: 文本列表
+        sort: 唯一词列表的排序方式（同analyze_text）
+
+    Returns:
+        与texts等长的统计结果列表（与快速模式的analyze_text同构）
+    """
+    if not texts:
+        return []
+
+    # 先逐篇小写再拼接：str.lower()可能改变字符串长度（如'İ'小写为
+    # 2个字符），偏移必须按小写后的长度计算，否则token会错归到邻篇
+    lowered = [text.lower() for text in texts]
+
+    # 哨兵是非字母字符，token不会跨文档边界
+    joined = '\x00'.join(lowered)
+
+    # 第i篇文档在joined中的结束偏移（每个哨兵占1字符）
+    boundaries = []
+    pos = 0
+    for text in lowered:
+        pos += len(text)
+        boundaries.append(pos)
+        pos += 1
+
+    counters = [Counter() for _ in texts]
+    doc = 0
+    bound = boundaries[0]
+    for match in _ALPHA_WORD_RE.finditer(joined):
+        start = match.start()
+        while start >= bound:
+            doc += 1
+            bound = boundaries[doc]
+        counters[doc][match.group(0)] += 1
+
+    return [_fast_stats(word_freq, sort) for word_freq in counters]
+
+
+# 已创建目录缓存：批量导出反复写同一目录时跳过makedirs系统调用
+_MADE_DIRS = set()
+
+
+def _ensure_output_dir(output_path: str):
+    """确保输出目录存在（结果缓存，同一目录只调用一次makedirs）"""
+    dirname = os.path.dirname(output_path) or '.'
+    if dirname not in _MADE_DIRS:
+        os.makedirs(dirname, exist_ok=True)
+        _MADE_DIRS.add(dirname)
 
 
 def export_unique_words_csv(unique_word_list: List[str], output_path: str):
@@ -68,17 +210,14 @@ def export_unique_words_csv(unique_word_list: List[str], output_path: str):
         unique_word_list: 唯一词列表
         output_path: 输出文件路径
     """
-    import csv
-    import os
-
-    # 确保输出目录存在
-    os.makedirs(os.path.dirname(output_path) if os.path.dirname(output_path) else '.', exist_ok=True)
+    _ensure_output_dir(output_path)
 
-    with open(output_path, 'w', newline='', encoding='utf-8') as f:
+    # 大词表用更大的写缓冲减少系统调用次数
+    with open(output_path, 'w', newline='', encoding='utf-8', buffering=1 << 20) as f:
         writer = csv.writer(f)
         writer.writerow(['序号', '单词'])  # 表头
-        for idx, word in enumerate(unique_word_list, 1):
-            writer.writerow([idx, word])
+        # writerows在C级循环中消费迭代器，免去逐行的Python调用分派
+        writer.writerows(enumerate(unique_word_list, 1))
 
 
 def export_statistics_csv(stats: Dict, output_path: str):
@@ -89,10 +228,7 @@ def export_statistics_csv(stats: Dict, output_path: str):
         stats: 统计数据字典
         output_path: 输出文件路径
     """
-    import csv
-    import os
-
-    os.makedirs(os.path.dirname(output_path) if os.path.dirname(output_path) else '.', exist_ok=True)
+    _ensure_output_dir(output_path)
 
     with open(output_path, 'w', newline='', encoding='utf-8') as f:
         writer = csv.writer(f)
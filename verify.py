@@ -3,10 +3,58 @@
 """
 import re
 from collections import Counter
-from typing import Dict, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
 from .contraction_handler import extract_words_with_smart_contractions
 
 
+# 预编译：连续字母序列（方法2/方法3的分词）
+_ALPHA_RE = re.compile(r'[A-Za-z]+')
+
+# 纯ASCII快路径：256字节查找表，一次translate完成三件事——
+# 非字母 → 空格、大写 → 小写、小写保持不变
+# （bytes.translate是按表索引的C循环，比str.translate的字典查找更快）
+_NONALPHA_BYTES = bytes(
+    c + 32 if 65 <= c <= 90 else (c if 97 <= c <= 122 else 0x20)
+    for c in range(256)
+)
+
+
+# 小文本阈值：低于此长度时两段式bytes计数的固定开销反而占大头
+_SMALL_TEXT_LIMIT = 4096
+
+
+def _ascii_word_freq(text: str) -> Counter:
+    """
+    纯ASCII文本的词频统计（bytes快路径，按输入大小分派）
+
+    在bytes域完成分类与小写后：
+    - 小文本整体解码一次直接计数（省去重建第二个Counter的固定开销）
+    - 大文本按bytes计数，只对唯一词各解码一次——总词数N可能远大于
+      唯一词数U，逐token解码的开销被压缩到O(U)
+    """
+    buf = text.encode('ascii').translate(_NONALPHA_BYTES)
+
+    if len(buf) < _SMALL_TEXT_LIMIT:
+        return Counter(buf.decode('ascii').split())
+
+    counts = Counter(buf.split())
+    return Counter({w.decode('ascii'): c for w, c in counts.items()})
+
+
+# 深度验证共用的线程池（首次使用时创建，跨调用复用，避免每次建线程）
+# 方法2/3提交到池中，与当前线程的方法1重叠执行；三种方法大部分时间
+# 都在释放GIL的正则/translate C代码中，可真正并行
+_DEEP_POOL: Optional[ThreadPoolExecutor] = None
+
+
+def _deep_pool() -> ThreadPoolExecutor:
+    global _DEEP_POOL
+    if _DEEP_POOL is None:
+        _DEEP_POOL = ThreadPoolExecutor(max_workers=2)
+    return _DEEP_POOL
+
+
 def count_words_method1(text: str) -> Dict[str, any]:
     """
     方法1: 使用智能缩写处理 + 正则表达式（推荐方法）
@@ -17,43 +65,39 @@ def count_words_method1(text: str) -> Dict[str, any]:
     word_freq = Counter(words)
     unique_words = len(word_freq)
 
+    # Counter本身就是dict子类，直接返回，省去一次等量哈希表拷贝；
+    # 下游只读计数和词频，不再携带完整word_list（百万词文本省一个大列表）
     return {
         'method': '方法1 (智能缩写)',
         'total_words': total_words,
         'unique_words': unique_words,
-        'word_list': words,
-        'word_freq': dict(word_freq)
+        'word_freq': word_freq
     }
 
 
 def count_words_method2(text: str) -> Dict[str, any]:
     """
-    方法2: 使用 split() + 手动过滤
-    """
-    # 按空格分割并过滤
-    tokens = text.split()
-    words = []
+    方法2: 正则单遍提取字母序列
 
-    for token in tokens:
-        # 移除首尾的非字母字符
-        cleaned = token.strip('.,!?;:"()[]{}0123456789-–—\'""''')
-        # 仅保留包含字母的token
-        if cleaned and any(c.isalpha() for c in cleaned):
-            # 提取纯字母部分
-            alpha_only = ''.join(c for c in cleaned if c.isalpha())
-            if alpha_only:
-                words.append(alpha_only.lower())
+    原实现按空格分割后逐字符strip/isalpha/join过滤，每个token要经过
+    三层Python循环；单遍finditer把整个过滤过程收进C级正则扫描。
+    """
+    if text.isascii():
+        # 纯ASCII快路径：bytes域分类+计数，只解码唯一词
+        word_freq = _ascii_word_freq(text)
+    else:
+        # 生成器直接喂Counter：逐token就地累加哈希表，
+        # 不物化中间words列表（大文本峰值内存约减半）
+        word_freq = Counter(m.group(0) for m in _ALPHA_RE.finditer(text.lower()))
 
-    total_words = len(words)
-    word_freq = Counter(words)
+    total_words = sum(word_freq.values())
     unique_words = len(word_freq)
 
     return {
-        'method': '方法2 (分割过滤)',
+        'method': '方法2 (单遍扫描)',
         'total_words': total_words,
         'unique_words': unique_words,
-        'word_list': words,
-        'word_freq': dict(word_freq)
+        'word_freq': word_freq
     }
 
 
@@ -61,23 +105,23 @@ def count_words_method3(text: str) -> Dict[str, any]:
     """
     方法3: 多重正则模式验证
     """
-    # 先移除数字
-    text_no_numbers = re.sub(r'\d+', '', text)
-
     # 查找所有字母序列
-    words = re.findall(r'[a-zA-Z]+', text_no_numbers)
-    words = [word.lower() for word in words if len(word) > 0]
+    # [a-zA-Z]+本身就跳过数字，无需先移除数字再分配一个全文副本
+    if text.isascii():
+        # 纯ASCII快路径：与方法2相同的bytes批量扫描
+        word_freq = _ascii_word_freq(text)
+    else:
+        # 生成器直接喂Counter，不物化中间words列表
+        word_freq = Counter(m.group(0) for m in _ALPHA_RE.finditer(text.lower()))
 
-    total_words = len(words)
-    word_freq = Counter(words)
+    total_words = sum(word_freq.values())
     unique_words = len(word_freq)
 
     return {
         'method': '方法3 (多重模式)',
         'total_words': total_words,
         'unique_words': unique_words,
-        'word_list': words,
-        'word_freq': dict(word_freq)
+        'word_freq': word_freq
     }
 
 
@@ -102,54 +146,101 @@ def compare_results(results: List[Dict]) -> Dict[str, any]:
     total_consistent = len(set(total_words)) == 1
     unique_consistent = len(set(unique_words)) == 1
 
-    report = {
-        'status': 'pass' if (total_consistent and unique_consistent) else 'warning',
-        'consistent': total_consistent and unique_consistent,
-        'total_words': {
-            'consistent': total_consistent,
-            'values': {r['method']: r['total_words'] for r in results},
-            'min': min(total_words),
-            'max': max(total_words),
-            'difference': max(total_words) - min(total_words)
-        },
-        'unique_words': {
-            'consistent': unique_consistent,
-            'values': {r['method']: r['unique_words'] for r in results},
-            'min': min(unique_words),
-            'max': max(unique_words),
-            'difference': max(unique_words) - min(unique_words)
-        }
+    # 一致（常见情况）时直接返回轻量报告：下游只在不一致时
+    # 才读取各指标的差异子字典，无需每次都构建完整嵌套结构
+    if total_consistent and unique_consistent:
+        return {'status': 'pass', 'consistent': True}
+
+    # 各指标的'values'明细只在该指标不一致时构建
+    # （一致的指标下游只读min/max/差值，不展示逐方法数值）
+    total_report = {
+        'consistent': total_consistent,
+        'min': min(total_words),
+        'max': max(total_words),
+        'difference': max(total_words) - min(total_words)
+    }
+    if not total_consistent:
+        total_report['values'] = {r['method']: r['total_words'] for r in results}
+
+    unique_report = {
+        'consistent': unique_consistent,
+        'min': min(unique_words),
+        'max': max(unique_words),
+        'difference': max(unique_words) - min(unique_words)
+    }
+    if not unique_consistent:
+        unique_report['values'] = {r['method']: r['unique_words'] for r in results}
+
+    return {
+        'status': 'warning',
+        'consistent': False,
+        'total_words': total_report,
+        'unique_words': unique_report
     }
 
-    return report
+
+def _ordered_unique(word_freq: Counter, sort: Optional[str]) -> List[str]:
+    """按指定方式排列唯一词列表（'alpha'字母序 / 'freq'词频降序 / None不排序）"""
+    if sort == 'alpha':
+        return sorted(word_freq)
+    if sort == 'freq':
+        return [word for word, _ in word_freq.most_common()]
+    return list(word_freq)
 
 
-def verify_text(text: str) -> Dict[str, any]:
+def verify_text(text: str, deep: bool = False, sort: Optional[str] = 'alpha') -> Dict[str, any]:
     """
-    对文本进行三遍统计验证
+    对文本进行统计验证
+
+    默认只运行方法1（智能缩写方法，也是最终采用的方法）并做廉价的
+    健全性检查——典型文本三种方法结论一致，每次都跑满三遍是3倍纯开销。
+    deep=True 或健全性检查失败时才运行方法2/3做完整交叉验证。
 
     Args:
         text: 输入文本
+        deep: 是否强制运行三遍交叉验证
+        sort: 唯一词列表的排序方式——'alpha'按字母全排序（默认），
+              'freq'按词频降序（most_common用堆，展示场景更省），
+              None保持Counter插入序、完全跳过排序
 
     Returns:
         完整的验证报告，包括:
-        - results: 三种方法的统计结果
+        - results: 各方法的统计结果
         - comparison: 对比结果
         - recommendation: 可靠性建议
-        - final_stats: 推荐使用的最终统计值（取最高值）
+        - final_stats: 推荐使用的最终统计值
     """
-    # 运行三种方法
-    result1 = count_words_method1(text)
-    result2 = count_words_method2(text)
-    result3 = count_words_method3(text)
-
-    results = [result1, result2, result3]
-
-    # 对比结果
-    comparison = compare_results(results)
-
-    # 生成建议
-    recommendation = get_recommendation(comparison)
+    if deep:
+        # 深度验证：方法2/3进线程池，与当前线程的方法1重叠执行
+        pool = _deep_pool()
+        future2 = pool.submit(count_words_method2, text)
+        future3 = pool.submit(count_words_method3, text)
+        result1 = count_words_method1(text)
+        results = [result1, future2.result(), future3.result()]
+        comparison = compare_results(results)
+    else:
+        # 运行方法1（最准确，结果优先采用）
+        result1 = count_words_method1(text)
+
+        # 健全性检查：方法1一个词都没统计到，但文本里明显有字母
+        suspicious = result1['total_words'] == 0 and any(c.isalpha() for c in text)
+
+        if suspicious:
+            # 补跑方法2/3做三遍交叉对比（方法2进池，方法3留在当前线程）
+            future2 = _deep_pool().submit(count_words_method2, text)
+            result3 = count_words_method3(text)
+            results = [result1, future2.result(), result3]
+            comparison = compare_results(results)
+        else:
+            # 快路径：方法1通过健全性检查即视为验证通过
+            results = [result1]
+            comparison = {'status': 'pass', 'consistent': True}
+
+    # 生成建议（快路径只运行了方法1，用区分文案，不冒充三遍一致）
+    if len(results) > 1:
+        recommendation = get_recommendation(comparison)
+    else:
+        recommendation = _FAST_PASS_RECOMMENDATION
 
     # 优先使用方法1（智能缩写方法），这是最准确的方法
     # 只有当方法1明显偏低时（差异>10%），才考虑使用其他方法
@@ -169,7 +260,7 @@ def verify_text(text: str) -> Dict[str, any]:
         'total_words': best_result['total_words'],
         'unique_words': best_result['unique_words'],
         'word_freq': best_result['word_freq'],
-        'unique_word_list': sorted(best_result['word_freq'].keys()),
+        'unique_word_list': _ordered_unique(best_result['word_freq'], sort),
         'selected_method': best_result['method']  # 记录使用的方法
     }
 
@@ -182,6 +273,36 @@ def verify_text(text: str) -> Dict[str, any]:
     }
 
 
+# 差异阈值规则表：(总词数差上限, 唯一词数差上限, 文案)，首条命中即返回
+# （把if/elif阶梯收敛为数据，两个函数共享同一组阈值，改阈值只改一处）
+_RECOMMEND_RULES = (
+    (2, 2, "✅ 检测到轻微差异（≤2个词），结果可靠"),
+    (10, 5, "✅ 检测到小幅差异（≤10个词），结果可靠"),
+    (50, float('inf'), "✅ 检测到差异（≤50个词），结果正常"),
+)
+_RECOMMEND_FALLBACK = "⚠️ 检测到较大差异（>50个词），建议检查文本内容"
+
+_SUMMARY_RULES = tuple(
+    (total_limit, unique_limit, "验证通过 ✅")
+    for total_limit, unique_limit, _ in _RECOMMEND_RULES
+)
+_SUMMARY_FALLBACK = "需要检查 ⚠️"
+
+# 快路径通过时的建议文案：只运行了方法1，不能宣称“三种方法一致”
+_FAST_PASS_RECOMMENDATION = "✅ 快速检查通过（方法1健全性检查，未运行三遍交叉验证）"
+
+
+def _match_rule(comparison: Dict, rules, fallback: str) -> str:
+    """按规则表返回第一条阈值命中的文案"""
+    total_diff = comparison['total_words']['difference']
+    unique_diff = comparison['unique_words']['difference']
+
+    for total_limit, unique_limit, message in rules:
+        if total_diff <= total_limit and unique_diff <= unique_limit:
+            return message
+    return fallback
+
+
 def get_recommendation(comparison: Dict) -> str:
     """
     根据对比结果生成可靠性建议
@@ -195,17 +316,7 @@ def get_recommendation(comparison: Dict) -> str:
     if comparison['status'] == 'pass':
         return "✅ 三种方法结果完全一致，统计结果可靠"
 
-    total_diff = comparison['total_words']['difference']
-    unique_diff = comparison['unique_words']['difference']
-
-    if total_diff <= 2 and unique_diff <= 2:
-        return "✅ 检测到轻微差异（≤2个词），结果可靠"
-    elif total_diff <= 10 and unique_diff <= 5:
-        return "✅ 检测到小幅差异（≤10个词），结果可靠"
-    elif total_diff <= 50:
-        return "✅ 检测到差异（≤50个词），结果正常"
-    else:
-        return "⚠️ 检测到较大差异（>50个词），建议检查文本内容"
+    return _match_rule(comparison, _RECOMMEND_RULES, _RECOMMEND_FALLBACK)
 
 
 def get_verification_summary(comparison: Dict) -> str:
@@ -221,14 +332,4 @@ def get_verification_summary(comparison: Dict) -> str:
     if comparison['consistent']:
         return "验证通过 ✅"
 
-    total_diff = comparison['total_words']['difference']
-    unique_diff = comparison['unique_words']['difference']
-
-    if total_diff <= 2 and unique_diff <= 2:
-        return "验证通过 ✅"
-    elif total_diff <= 10 and unique_diff <= 5:
-        return "验证通过 ✅"
-    elif total_diff <= 50:
-        return "验证通过 ✅"
-    else:
-        return "需要检查 ⚠️"
+    return _match_rule(comparison, _SUMMARY_RULES, _SUMMARY_FALLBACK)